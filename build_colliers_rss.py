@@ -1,14 +1,22 @@
 import argparse
+import bisect
+import heapq
 import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from itertools import chain, islice
 from urllib.parse import urljoin, urlparse
+from xml.sax.saxutils import escape
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
-from feedgen.feed import FeedGenerator
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from requests_cache import EXPIRE_IMMEDIATELY, CachedSession
 
 UTC = timezone.utc
 EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
@@ -18,17 +26,98 @@ COLLIERS_HOME_URL = "https://www.colliers.com/en"
 NORTHMARQ_LISTING_URL = "https://www.northmarq.com/recent-closings-transactions"
 NORTHMARQ_BASE = "https://www.northmarq.com"
 
+MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# Both patterns capture (month, day, year) as groups 1-3 for date_from_match().
 DATE_RE = re.compile(
-    r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}\b"
+    r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})\b"
 )
 
 DATE_AT_START_RE = re.compile(
-    r"^\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4})\s+(.+)$"
+    r"^\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),\s+(\d{4})\s+(.+)$"
 )
 
+# Absolute http(s) URLs that urljoin/urlparse would hand back unchanged up
+# to the query; anything unusual (whitespace, ";params", odd hosts) takes
+# the full path in normalize_url().
+PLAIN_ABSOLUTE_URL_RE = re.compile(r"(https?://[A-Za-z0-9.-]+(?::\d+)?(?:/[^\s?#;]*)?)(?:[?#]|\Z)")
+
 NORTHMARQ_DATE_IN_SLUG_RE = re.compile(r"-(\d{4})-(\d{2})(?:-(\d{2}))?(?:$|/)")
 
-COLLIERS_SKIP_TEXT = {
+# Elements whose text is not page copy (bs4's get_text leaves these out too).
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# Colliers subtrees removed right after parsing.
+COLLIERS_PRUNED_TAGS = ("script", "style")
+
+# Read size when pushing markup into an incremental HTML parser.
+HTML_CHUNK_SIZE = 64 * 1024
+
+# Concurrent Northmarq load_more page requests.
+NORTHMARQ_MAX_WORKERS = 4
+
+
+def _has_class(name: str) -> str:
+    # XPath test for one class token, the way CSS's .name matches.
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Text nodes under an element, minus script/style/template: the strings
+# bs4's get_text would join.
+VISIBLE_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+# Northmarq card fields, relative to the <article>.
+NORTHMARQ_LINK_XPATH = etree.XPath("descendant::a[@href][1]")
+NORTHMARQ_H3_XPATH = etree.XPath("descendant::h3[1]")
+NORTHMARQ_DEAL_TYPE_XPATH = etree.XPath(
+    f"descendant-or-self::*[{_has_class('field--name-field-deal-type')}]"
+    f"/descendant::*[{_has_class('field__item')}]"
+)
+NORTHMARQ_LOCALITY_XPATH = etree.XPath(
+    f"(descendant-or-self::*[{_has_class('field--name-field-address')}]"
+    f"/descendant::*[{_has_class('locality')}])[1]"
+)
+NORTHMARQ_ADMIN_AREA_XPATH = etree.XPath(
+    f"(descendant-or-self::*[{_has_class('field--name-field-address')}]"
+    f"/descendant::*[{_has_class('administrative-area')}])[1]"
+)
+NORTHMARQ_PRICE_XPATH = etree.XPath(f"descendant::*[{_has_class('field--name-field-price')}][1]")
+
+RSS_TITLE = "Colliers + Northmarq (unofficial)"
+RSS_DESCRIPTION = "Unofficial combined feed: Colliers news/research + Northmarq recent transactions."
+
+# On top of &, < and >: a literal CR would be folded into a newline by XML
+# parsers, so it is written as a character reference.
+RSS_ENTITIES = {"\r": "&#13;"}
+
+# Code points XML 1.0 does not allow at all, not even as references. Scraped
+# text can carry stray control characters; they are dropped so one bad title
+# can't make the whole feed unparseable.
+XML_ILLEGAL_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+# Connection pool per host; large enough that concurrent fetches never have
+# to open (and TLS-handshake) throwaway connections.
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 32
+
+COLLIERS_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+NORTHMARQ_HEADERS = {
+    "Accept": "*/*",
+    "Referer": NORTHMARQ_LISTING_URL,
+    "Origin": NORTHMARQ_BASE,
+    "X-Requested-With": "XMLHttpRequest",
+}
+
+COLLIERS_SKIP_TEXT = frozenset({
     "read more",
     "view more",
     "view all news",
@@ -37,7 +126,33 @@ COLLIERS_SKIP_TEXT = {
     "view media mentions",
     "learn more",
     "",
-}
+})
+
+# Section boundaries, matched against lowercased element text. The first
+# marker of the news-page start is a superset of the second, so the
+# shorter phrase alone covers both.
+COLLIERS_NEWS_START_RE = re.compile(r"latest commercial real estate news and trends")
+COLLIERS_NEWS_STOP_RE = re.compile(
+    r"podcasts|press releases / announcements|media mentions|knowledge leader"
+)
+COLLIERS_HOME_START_RE = re.compile(
+    r"news & research|the latest commercial real estate news, insights and trends"
+)
+COLLIERS_HOME_STOP_RE = re.compile(
+    r"enterprising to exceed expectations|our people & expertise in action"
+    r"|your needs|knowledge leader"
+)
+
+# Tags whose text is checked for the section start marker.
+COLLIERS_MARKER_TAGS = ("h1", "h2", "h3", "h4", "h5", "p", "div", "section")
+
+# Stop-marker candidates and links after an element, in document order.
+COLLIERS_STOP_CANDIDATES_XPATH = etree.XPath(
+    "descendant::*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::section]"
+    " | following::*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::section]"
+)
+ANCHORS_AFTER_XPATH = etree.XPath("descendant::a[@href] | following::a[@href]")
+ANCHOR_COUNT_FROM_XPATH = etree.XPath("count(descendant-or-self::a[@href] | following::a[@href])")
 
 COLLIERS_ALLOWED_PATH_PARTS = (
     "/en/news/",
@@ -53,24 +168,43 @@ def chrome_ua() -> str:
     )
 
 
+# Cards link the same article several times (image, title, "read more"),
+# and base is fixed for a page, so most calls are repeats.
+@lru_cache(maxsize=8192)
 def normalize_url(base: str, href: str) -> str:
+    # A plain absolute URL resolves to itself, so dropping the query and
+    # fragment is just a cut at the first "?" or "#".
+    m = PLAIN_ABSOLUTE_URL_RE.match(href)
+    if m:
+        return m.group(1).rstrip("/")
+
     u = urljoin(base, href)
     p = urlparse(u)
     return p._replace(query="", fragment="").geturl().rstrip("/")
 
 
-def parse_date(date_text: str | None) -> datetime | None:
-    if not date_text:
-        return None
+def date_from_match(m: re.Match) -> datetime | None:
+    # The regex already pins the "Mon D, YYYY" shape, so build the datetime
+    # directly rather than running it through a general date parser.
     try:
-        dt = dateparser.parse(date_text)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        return dt
-    except Exception:
+        return datetime(int(m.group(3)), MONTHS[m.group(1)], int(m.group(2)), tzinfo=UTC)
+    except ValueError:
         return None
 
 
+@dataclass(slots=True)
+class Item:
+    url: str
+    title: str
+    description: str
+    published: datetime | None
+    source: str
+
+
+def published_sort_key(item: Item) -> datetime:
+    return item.published or EPOCH
+
+
 def uniq_preserve(seq):
     seen = set()
     out = []
@@ -81,9 +215,42 @@ def uniq_preserve(seq):
     return out
 
 
-def safe_get(session: requests.Session, url: str, timeout: int = 30) -> requests.Response | None:
+def http_session(cache_name: str | None = None) -> requests.Session:
+    # One session for both sources: a single cache/connection pool, with the
+    # per-site Accept/Referer/XHR headers passed on each request.
+    if cache_name:
+        # Entries expire at once but keep their ETag/Last-Modified, so the
+        # next run sends a conditional request and an unchanged page comes
+        # back as a bodiless 304. No stale_if_error: it would answer a 403
+        # with the cached copy and skip the fallbacks below.
+        s = CachedSession(
+            cache_name,
+            backend="sqlite",
+            expire_after=EXPIRE_IMMEDIATELY,
+        )
+    else:
+        s = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(
+        {
+            "User-Agent": chrome_ua(),
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+    )
+    return s
+
+
+def safe_get(
+    session: requests.Session,
+    url: str,
+    timeout: int = 30,
+    headers: dict[str, str] | None = None,
+) -> requests.Response | None:
     try:
-        r = session.get(url, timeout=timeout, allow_redirects=True)
+        r = session.get(url, timeout=timeout, allow_redirects=True, headers=headers)
         if r.status_code >= 400:
             print(f"[HTTP] {url} returned {r.status_code}; trying fallback if available.")
             return None
@@ -93,90 +260,174 @@ def safe_get(session: requests.Session, url: str, timeout: int = 30) -> requests
         return None
 
 
+@lru_cache(maxsize=64)
+def parser_encoding(label: str | None) -> str | None:
+    # lxml raises LookupError for charset labels libxml2 can't decode (e.g.
+    # "none", "x-sjis"); treat those like no label at all, the way
+    # resp.text quietly falls back.
+    if not label:
+        return None
+    label = label.strip().strip("\"'")
+    try:
+        etree.HTMLParser(encoding=label)
+    except LookupError:
+        return None
+    return label
+
+
+def declared_encoding(resp: requests.Response) -> str | None:
+    # A charset from the Content-Type header wins; with None, libxml2 picks
+    # it up from the document's <meta> tag instead.
+    if "charset" in resp.headers.get("Content-Type", "").lower():
+        return parser_encoding(resp.encoding)
+    return None
+
+
+def parse_html(resp: requests.Response):
+    # Hand the raw body to lxml rather than decoding it into resp.text first;
+    # libxml2 does the decoding.
+    parser = lxml.html.HTMLParser(
+        encoding=declared_encoding(resp),
+        remove_comments=True,
+        remove_pis=True,
+    )
+
+    try:
+        return etree.fromstring(resp.content, parser)
+    except etree.LxmlError as e:
+        print(f"[HTTP] {resp.url} could not be read: {e}")
+        return None
+
+
 # -----------------------
 # Colliers
 # -----------------------
 
-def colliers_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update(
-        {
-            "User-Agent": chrome_ua(),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-    )
-    return s
-
+class PageText:
+    """Visible text of a parsed page, built in a single walk of the tree.
+
+    text(el) returns what bs4's get_text(" ", strip=True) would for el: the
+    stripped text nodes joined with spaces, script/style/template left out.
+    Every element's text is a slice of one page-wide string, and DATE_RE is
+    run over that string once, so looking up an element's text or first
+    date never re-walks its subtree.
+    """
+
+    def __init__(self, root):
+        pieces: list[str] = []
+        offsets: list[int] = []
+        spans: dict = {}
+        open_at: list[int] = []
+        pos = 0
+        skip = 0
+
+        def add(text: str | None) -> None:
+            nonlocal pos
+            if skip or not text:
+                return
+            text = text.strip()
+            if not text:
+                return
+            if pieces:
+                pos += 1
+            offsets.append(pos)
+            pieces.append(text)
+            pos += len(text)
+
+        for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+            if event == "start":
+                if el.tag in NON_TEXT_TAGS:
+                    skip += 1
+                open_at.append(len(pieces))
+                add(el.text)
+            elif event == "end":
+                if el.tag in NON_TEXT_TAGS:
+                    skip -= 1
+                first = open_at.pop()
+                last = len(pieces)
+                if last > first:
+                    spans[el] = (offsets[first], offsets[last - 1] + len(pieces[last - 1]))
+                add(el.tail)
+            else:
+                add(el.tail)
+
+        self._text = " ".join(pieces)
+        self._spans = spans
+        self._dates = list(DATE_RE.finditer(self._text))
+        self._date_starts = [m.start() for m in self._dates]
+
+    def text(self, el) -> str:
+        span = self._spans.get(el)
+        return self._text[span[0]:span[1]] if span else ""
+
+    def text_length(self, el) -> int:
+        # len(text(el)) without slicing the string out.
+        span = self._spans.get(el)
+        return span[1] - span[0] if span else 0
+
+    def first_date(self, el) -> re.Match | None:
+        # Matches never overlap, so the first one starting inside el's slice
+        # is el's first date if it also ends inside it.
+        span = self._spans.get(el)
+        if not span:
+            return None
+        i = bisect.bisect_left(self._date_starts, span[0])
+        if i < len(self._dates) and self._dates[i].end() <= span[1]:
+            return self._dates[i]
+        return None
 
-def find_first_text_marker(soup: BeautifulSoup, markers: list[str]):
-    markers_lower = [m.lower() for m in markers]
 
-    for tag in soup.find_all(["h1", "h2", "h3", "h4", "h5", "p", "div", "section"]):
-        text = tag.get_text(" ", strip=True).lower()
-        if any(marker in text for marker in markers_lower):
+def find_first_text_marker(root, page: PageText, marker_re: re.Pattern):
+    for tag in root.iter(*COLLIERS_MARKER_TAGS):
+        if marker_re.search(page.text(tag).lower()):
             return tag
 
     return None
 
 
-def find_next_stop_after(start_tag, stop_markers: list[str]):
-    if not start_tag:
+def find_next_stop_after(start_tag, page: PageText, stop_re: re.Pattern):
+    if start_tag is None:
         return None
 
-    stop_lower = [s.lower() for s in stop_markers]
-
-    for el in start_tag.next_elements:
-        if getattr(el, "name", None) not in ["h1", "h2", "h3", "h4", "h5", "section"]:
-            continue
-        text = el.get_text(" ", strip=True).lower()
-        if any(stop in text for stop in stop_lower):
+    for el in COLLIERS_STOP_CANDIDATES_XPATH(start_tag):
+        if stop_re.search(page.text(el).lower()):
             return el
 
     return None
 
 
-def elements_between(start_tag, stop_tag):
-    if not start_tag:
+def anchors_between(start_tag, stop_tag) -> list:
+    if start_tag is None:
         return []
 
-    out = []
-    for el in start_tag.next_elements:
-        if stop_tag is not None and el is stop_tag:
-            break
-        out.append(el)
-
-    return out
-
+    anchors = ANCHORS_AFTER_XPATH(start_tag)
+    if stop_tag is None:
+        return anchors
 
-def colliers_find_card_with_date(anchor, max_up: int = 10):
-    node = anchor
+    # Everything from stop_tag onwards is also after start_tag, and both
+    # lists are in document order, so the section is a prefix of anchors.
+    from_stop = int(ANCHOR_COUNT_FROM_XPATH(stop_tag))
+    return anchors[: len(anchors) - from_stop]
 
-    for _ in range(max_up):
-        if not getattr(node, "get_text", None):
-            break
 
-        text = node.get_text(" ", strip=True)
-        if DATE_RE.search(text):
+def colliers_find_card_with_date(anchor, page: PageText, max_up: int = 10):
+    for node in islice(chain((anchor,), anchor.iterancestors()), max_up):
+        if page.first_date(node):
             return node
 
-        node = getattr(node, "parent", None)
-        if node is None:
-            break
+    parent = anchor.getparent()
+    return parent if parent is not None else anchor
 
-    return anchor.parent if getattr(anchor, "parent", None) else anchor
 
-
-def colliers_extract_date_from_card(card) -> datetime | None:
-    if not card or not getattr(card, "get_text", None):
+def colliers_extract_date_from_card(card, page: PageText) -> datetime | None:
+    if card is None:
         return None
 
-    text = card.get_text(" ", strip=True)
-    m = DATE_RE.search(text)
+    m = page.first_date(card)
     if not m:
         return None
 
-    return parse_date(m.group(0))
+    return date_from_match(m)
 
 
 def colliers_clean_title(raw_title: str) -> tuple[str, datetime | None]:
@@ -184,37 +435,36 @@ def colliers_clean_title(raw_title: str) -> tuple[str, datetime | None]:
     m = DATE_AT_START_RE.match(title)
 
     if m:
-        dt = parse_date(m.group(1))
-        title = m.group(2).strip()
+        dt = date_from_match(m)
+        title = m.group(4).strip()
         return title, dt
 
     return title, None
 
 
-def colliers_extract_description(card, title: str) -> str:
-    if not card or not getattr(card, "find_all", None):
+def colliers_extract_description(card, page: PageText, title: str) -> str:
+    if card is None:
         return ""
 
-    for p in card.find_all(["p", "div"]):
-        text = p.get_text(" ", strip=True)
-        if not text:
+    for p in card.iterdescendants("p", "div"):
+        # Most card paragraphs/divs fail the length bound, so test it before
+        # pulling out, lowercasing or regex-matching their text.
+        if not 15 <= page.text_length(p) <= 500:
             continue
 
-        low = text.lower().strip()
+        text = page.text(p)
+        low = text.lower()
 
         if low in COLLIERS_SKIP_TEXT:
             continue
-        if text.strip() == title.strip():
+        if text == title:
             continue
-        if DATE_RE.fullmatch(text.strip()):
+        if DATE_RE.fullmatch(text):
             continue
         if "view all news" in low:
             continue
-        if "read more" == low:
-            continue
 
-        if 15 <= len(text) <= 500:
-            return text
+        return text
 
     return ""
 
@@ -229,90 +479,95 @@ def is_colliers_content_url(url: str) -> bool:
 
 
 def colliers_extract_from_section(
-    soup: BeautifulSoup,
+    root,
+    page: PageText,
     listing_url: str,
-    start_markers: list[str],
-    stop_markers: list[str],
+    start_re: re.Pattern,
+    stop_re: re.Pattern,
     limit: int,
-) -> list[dict]:
-    start = find_first_text_marker(soup, start_markers)
-    if not start:
+) -> list[Item]:
+    start = find_first_text_marker(root, page, start_re)
+    if start is None:
         return []
 
-    stop = find_next_stop_after(start, stop_markers)
-    elements = elements_between(start, stop)
-
-    by_url: dict[str, dict] = {}
-
-    for el in elements:
-        if getattr(el, "name", None) != "a":
-            continue
+    stop = find_next_stop_after(start, page, stop_re)
+    by_url: dict[str, Item] = {}
 
+    for el in anchors_between(start, stop):
         href = el.get("href")
         if not href:
             continue
 
+        # Most anchors are navigation/footer/social links; drop them on the
+        # raw href before paying for URL parsing.
+        if not any(part in href for part in COLLIERS_ALLOWED_PATH_PARTS):
+            continue
+
         url = normalize_url(listing_url, href)
 
         if not is_colliers_content_url(url):
             continue
 
-        raw_title = el.get_text(" ", strip=True)
+        raw_title = page.text(el)
         title, date_from_title = colliers_clean_title(raw_title)
 
         if not title:
             continue
-        if title.lower().strip() in COLLIERS_SKIP_TEXT:
+        if title.lower() in COLLIERS_SKIP_TEXT:
             continue
         if len(title) < 6:
             continue
 
-        card = colliers_find_card_with_date(el)
-        published = date_from_title or colliers_extract_date_from_card(card)
-        desc = colliers_extract_description(card, title)
-
+        # Only do the card lookups for fields an earlier link left empty.
         existing = by_url.get(url)
-        if not existing:
-            by_url[url] = {
-                "url": url,
-                "title": title,
-                "description": desc,
-                "published": published,
-                "source": "Colliers",
-            }
+        need_date = existing is None or existing.published is None
+        need_desc = existing is None or not existing.description
+
+        published = date_from_title
+        desc = ""
+        if need_desc or (need_date and published is None):
+            card = colliers_find_card_with_date(el, page)
+            if need_date and published is None:
+                published = colliers_extract_date_from_card(card, page)
+            if need_desc:
+                desc = colliers_extract_description(card, page, title)
+
+        if existing is None:
+            by_url[url] = Item(
+                url=url,
+                title=title,
+                description=desc,
+                published=published,
+                source="Colliers",
+            )
         else:
-            if existing.get("published") is None and published is not None:
-                existing["published"] = published
-            if not existing.get("description") and desc:
-                existing["description"] = desc
-            if len(title) > len(existing.get("title", "")):
-                existing["title"] = title
+            if existing.published is None and published is not None:
+                existing.published = published
+            if not existing.description and desc:
+                existing.description = desc
+            if len(title) > len(existing.title):
+                existing.title = title
 
         if len(by_url) >= limit:
             break
 
     items = list(by_url.values())
-    items.sort(key=lambda x: x.get("published") or EPOCH, reverse=True)
+    items.sort(key=published_sort_key, reverse=True)
     return items[:limit]
 
 
-def colliers_extract_items_from_page(html: str, listing_url: str, limit: int) -> list[dict]:
-    soup = BeautifulSoup(html, "html.parser")
+def colliers_extract_items_from_page(root, listing_url: str, limit: int) -> list[Item]:
+    # Colliers cards are located by walking up from each link to find the
+    # date and summary, so the whole document is needed here.
+    page = PageText(root)
 
     # Original page section: top news only, stop before Podcasts.
     items = colliers_extract_from_section(
-        soup=soup,
+        root=root,
+        page=page,
         listing_url=listing_url,
-        start_markers=[
-            "keep up with the latest commercial real estate news and trends",
-            "latest commercial real estate news and trends",
-        ],
-        stop_markers=[
-            "podcasts",
-            "press releases / announcements",
-            "media mentions",
-            "knowledge leader",
-        ],
+        start_re=COLLIERS_NEWS_START_RE,
+        stop_re=COLLIERS_NEWS_STOP_RE,
         limit=limit,
     )
 
@@ -321,25 +576,18 @@ def colliers_extract_items_from_page(html: str, listing_url: str, limit: int) ->
 
     # Fallback: Colliers homepage "News & Research" section.
     items = colliers_extract_from_section(
-        soup=soup,
+        root=root,
+        page=page,
         listing_url=listing_url,
-        start_markers=[
-            "news & research",
-            "the latest commercial real estate news, insights and trends",
-        ],
-        stop_markers=[
-            "enterprising to exceed expectations",
-            "our people & expertise in action",
-            "your needs",
-            "knowledge leader",
-        ],
+        start_re=COLLIERS_HOME_START_RE,
+        stop_re=COLLIERS_HOME_STOP_RE,
         limit=limit,
     )
 
     return items
 
 
-def get_colliers_items(primary_url: str | None, limit: int) -> list[dict]:
+def get_colliers_items(session: requests.Session, primary_url: str | None, limit: int) -> list[Item]:
     urls = []
 
     if primary_url:
@@ -353,14 +601,21 @@ def get_colliers_items(primary_url: str | None, limit: int) -> list[dict]:
     )
 
     urls = uniq_preserve(urls)
-    session = colliers_session()
 
     for url in urls:
-        response = safe_get(session, url)
+        response = safe_get(session, url, headers=COLLIERS_HEADERS)
         if response is None:
             continue
 
-        items = colliers_extract_items_from_page(response.text, url, limit)
+        root = parse_html(response)
+
+        if root is not None:
+            # lxml has no SoupStrainer, so prune after the fact: scripts and
+            # styles hold no links or visible text, and dropping them keeps
+            # every later walk over the tree shorter.
+            etree.strip_elements(root, *COLLIERS_PRUNED_TAGS, with_tail=False)
+
+        items = colliers_extract_items_from_page(root, url, limit) if root is not None else []
         if items:
             print(f"[Colliers] Using {url} ({len(items)} items)")
             return items
@@ -375,21 +630,6 @@ def get_colliers_items(primary_url: str | None, limit: int) -> list[dict]:
 # Northmarq
 # -----------------------
 
-def northmarq_session() -> requests.Session:
-    s = requests.Session()
-    s.headers.update(
-        {
-            "User-Agent": chrome_ua(),
-            "Accept": "*/*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Referer": NORTHMARQ_LISTING_URL,
-            "Origin": NORTHMARQ_BASE,
-            "X-Requested-With": "XMLHttpRequest",
-        }
-    )
-    return s
-
-
 def northmarq_published_from_url(url: str) -> datetime | None:
     m = NORTHMARQ_DATE_IN_SLUG_RE.search(url)
     if not m:
@@ -405,11 +645,19 @@ def northmarq_published_from_url(url: str) -> datetime | None:
         return None
 
 
-def northmarq_decode_load_more_response(resp: requests.Response) -> str:
+def response_markup(resp: requests.Response) -> str | bytes:
+    # Raw bytes only when the header names a charset libxml2 can use. Without
+    # one, libxml2 won't spot UTF-8 that has no BOM or <meta>, so let
+    # requests decode it (falling back to apparent_encoding for non-text
+    # types) as resp.text always did.
+    return resp.content if declared_encoding(resp) else resp.text
+
+
+def northmarq_decode_load_more_response(resp: requests.Response) -> str | bytes:
     try:
         payload = resp.json()
     except Exception:
-        return resp.text
+        return response_markup(resp)
 
     html_parts: list[str] = []
 
@@ -425,117 +673,189 @@ def northmarq_decode_load_more_response(resp: requests.Response) -> str:
         if isinstance(data, str) and data:
             html_parts.append(data)
 
-    return "\n".join(html_parts) if html_parts else resp.text
+    return "\n".join(html_parts) if html_parts else response_markup(resp)
 
 
-def northmarq_items_from_card_html(html: str, limit: int) -> list[dict]:
-    soup = BeautifulSoup(html, "html.parser")
-    by_url: dict[str, dict] = {}
+def element_text(el, sep: str = " ") -> str:
+    return sep.join(t for t in (t.strip() for t in VISIBLE_TEXT_XPATH(el)) if t)
 
-    for article in soup.find_all("article"):
-        a = article.find("a", href=True)
-        if not a:
-            continue
 
-        href = a["href"].strip()
-        if not href.startswith("/transactions/"):
-            continue
+def northmarq_iter_cards(html: str | bytes, encoding: str | None = None):
+    # Push the markup through lxml in chunks and hand back each <article> as
+    # soon as it closes, so a caller that stops early never parses the rest.
+    # Cards are self-contained; once one has been read it and everything
+    # before it are dropped, which keeps the tree to roughly one card.
+    # Raw bytes are fed as-is so libxml2 does the decoding.
+    parser = etree.HTMLPullParser(
+        events=("end",),
+        tag="article",
+        encoding=parser_encoding(encoding) if isinstance(html, bytes) else None,
+    )
 
-        full_url = normalize_url(NORTHMARQ_BASE, href)
+    try:
+        for start in range(0, len(html), HTML_CHUNK_SIZE):
+            parser.feed(html[start:start + HTML_CHUNK_SIZE])
+            for _, article in parser.read_events():
+                yield article
+                article.clear()
+                while article.getprevious() is not None:
+                    del article.getparent()[0]
 
-        title = (a.get("aria-label") or "").strip()
-        if not title:
-            h3 = article.find("h3")
-            title = h3.get_text(" ", strip=True) if h3 else a.get_text(" ", strip=True)
+        parser.close()
+    except etree.LxmlError:
+        return
 
-        title = " ".join(title.split()).strip() or full_url
+    for _, article in parser.read_events():
+        yield article
 
-        deal_types = [
-            x.get_text(" ", strip=True)
-            for x in article.select(".field--name-field-deal-type .field__item")
-        ]
-        deal_types = [x for x in deal_types if x]
-        deal_types = ", ".join(uniq_preserve(deal_types))
 
-        locality = article.select_one(".field--name-field-address .locality")
-        admin = article.select_one(".field--name-field-address .administrative-area")
+def northmarq_item_from_card(article) -> Item | None:
+    found = NORTHMARQ_LINK_XPATH(article)
+    if not found:
+        return None
+    a = found[0]
+
+    href = a.get("href").strip()
+    if not href.startswith("/transactions/"):
+        return None
+
+    full_url = normalize_url(NORTHMARQ_BASE, href)
+
+    title = (a.get("aria-label") or "").strip()
+    if not title:
+        h3 = NORTHMARQ_H3_XPATH(article)
+        title = element_text(h3[0]) if h3 else element_text(a)
+
+    title = " ".join(title.split()).strip() or full_url
+
+    deal_types = [element_text(x) for x in NORTHMARQ_DEAL_TYPE_XPATH(article)]
+    deal_types = [x for x in deal_types if x]
+    deal_types = ", ".join(uniq_preserve(deal_types))
 
-        location = ""
-        if locality and admin:
-            location = f"{locality.get_text(strip=True)}, {admin.get_text(strip=True)}"
-        elif locality:
-            location = locality.get_text(strip=True)
+    locality = NORTHMARQ_LOCALITY_XPATH(article)
+    admin = NORTHMARQ_ADMIN_AREA_XPATH(article)
 
-        price_el = article.select_one(".field--name-field-price")
-        price = price_el.get_text(" ", strip=True) if price_el else ""
+    location = ""
+    if locality and admin:
+        location = f"{element_text(locality[0], '')}, {element_text(admin[0], '')}"
+    elif locality:
+        location = element_text(locality[0], "")
 
-        desc_parts = [p for p in [deal_types, location, price] if p]
-        desc = " — ".join(desc_parts)
+    price_el = NORTHMARQ_PRICE_XPATH(article)
+    price = element_text(price_el[0]) if price_el else ""
 
-        published = northmarq_published_from_url(full_url)
+    desc_parts = [p for p in [deal_types, location, price] if p]
+    desc = " — ".join(desc_parts)
+
+    return Item(
+        url=full_url,
+        title=title,
+        description=desc,
+        published=northmarq_published_from_url(full_url),
+        source="Northmarq",
+    )
 
-        if full_url not in by_url:
-            by_url[full_url] = {
-                "url": full_url,
-                "title": title,
-                "description": desc,
-                "published": published,
-                "source": "Northmarq",
-            }
+
+def northmarq_items_from_card_html(
+    html: str | bytes,
+    limit: int,
+    encoding: str | None = None,
+) -> list[Item]:
+    by_url: dict[str, Item] = {}
+
+    for article in northmarq_iter_cards(html, encoding):
+        item = northmarq_item_from_card(article)
+        if item is None:
+            continue
+
+        by_url.setdefault(item.url, item)
 
         if len(by_url) >= limit:
             break
 
     items = list(by_url.values())
-    items.sort(key=lambda x: x.get("published") or EPOCH, reverse=True)
+    items.sort(key=published_sort_key, reverse=True)
     return items[:limit]
 
 
-def get_northmarq_items(load_more_base: str | None, pages: int, limit: int) -> list[dict]:
+def northmarq_fetch_page(
+    session: requests.Session,
+    load_more_base: str,
+    page: int,
+    limit: int,
+) -> tuple[int | None, list[Item]]:
+    url = f"{load_more_base.rstrip('/')}/{page}"
+
+    try:
+        resp = session.get(url, timeout=30, headers=NORTHMARQ_HEADERS)
+    except Exception as e:
+        print(f"[Northmarq] Page {page} failed: {e}")
+        return None, []
+
+    if resp.status_code >= 400:
+        return resp.status_code, []
+
+    html = northmarq_decode_load_more_response(resp)
+    return resp.status_code, northmarq_items_from_card_html(html, limit, declared_encoding(resp))
+
+
+def get_northmarq_items(
+    session: requests.Session,
+    load_more_base: str | None,
+    pages: int,
+    limit: int,
+) -> list[Item]:
     if not load_more_base:
         print("[Northmarq] No load_more base configured. Skipping Northmarq.")
         return []
 
-    session = northmarq_session()
-
     try:
-        session.get(NORTHMARQ_LISTING_URL, timeout=30)
+        session.get(NORTHMARQ_LISTING_URL, timeout=30, headers=NORTHMARQ_HEADERS)
     except Exception:
         pass
 
-    by_url: dict[str, dict] = {}
-
-    for page in range(1, pages + 1):
-        url = f"{load_more_base.rstrip('/')}/{page}"
-
-        try:
-            resp = session.get(url, timeout=30)
-        except Exception as e:
-            print(f"[Northmarq] Page {page} failed: {e}")
+    # Page 1 goes alone: a 403 there means the bot check is up, and it should
+    # see one request, not a burst. Only if page 1 came through and left room
+    # under the limit are the remaining pages fetched (and parsed)
+    # concurrently; results are still merged in page order below.
+    results = [northmarq_fetch_page(session, load_more_base, 1, limit)] if pages >= 1 else []
+
+    if pages > 1 and results[0][0] != 403 and len(results[0][1]) < limit:
+        workers = min(pages - 1, NORTHMARQ_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results.extend(
+                pool.map(
+                    lambda page: northmarq_fetch_page(session, load_more_base, page, limit),
+                    range(2, pages + 1),
+                )
+            )
+
+    by_url: dict[str, Item] = {}
+
+    for page, (status, items) in enumerate(results, start=1):
+        if status is None:
             continue
 
-        if resp.status_code == 403:
+        if status == 403:
             print("[Northmarq] 403 on load_more endpoint. Trying listing-page fallback.")
             try:
-                fallback = session.get(NORTHMARQ_LISTING_URL, timeout=30)
+                fallback = session.get(NORTHMARQ_LISTING_URL, timeout=30, headers=NORTHMARQ_HEADERS)
                 if fallback.status_code >= 400:
                     print(f"[Northmarq] Listing-page fallback returned {fallback.status_code}. Skipping Northmarq.")
                     return []
-                return northmarq_items_from_card_html(fallback.text, limit)
+                return northmarq_items_from_card_html(
+                    response_markup(fallback), limit, declared_encoding(fallback)
+                )
             except Exception as e:
                 print(f"[Northmarq] Listing-page fallback failed: {e}. Skipping Northmarq.")
                 return []
 
-        if resp.status_code >= 400:
-            print(f"[Northmarq] Page {page} returned {resp.status_code}; skipping this page.")
+        if status >= 400:
+            print(f"[Northmarq] Page {page} returned {status}; skipping this page.")
             continue
 
-        html = northmarq_decode_load_more_response(resp)
-        items = northmarq_items_from_card_html(html, limit)
-
         for item in items:
-            if item["url"] not in by_url:
-                by_url[item["url"]] = item
+            by_url.setdefault(item.url, item)
 
             if len(by_url) >= limit:
                 break
@@ -543,10 +863,8 @@ def get_northmarq_items(load_more_base: str | None, pages: int, limit: int) -> l
         if len(by_url) >= limit:
             break
 
-        time.sleep(0.8)
-
     out = list(by_url.values())
-    out.sort(key=lambda x: x.get("published") or EPOCH, reverse=True)
+    out.sort(key=published_sort_key, reverse=True)
 
     print(f"[Northmarq] Found {len(out[:limit])} items")
     return out[:limit]
@@ -556,55 +874,72 @@ def get_northmarq_items(load_more_base: str | None, pages: int, limit: int) -> l
 # Merge + RSS writer
 # -----------------------
 
-def merge_items(lists: list[list[dict]], total_limit: int) -> list[dict]:
-    by_url: dict[str, dict] = {}
-
-    for item_list in lists:
-        for item in item_list:
-            url = item["url"]
-            existing = by_url.get(url)
-
-            if not existing:
-                by_url[url] = item
-                continue
+def merge_items(lists: list[list[Item]], total_limit: int) -> list[Item]:
+    # Every source hands back its items newest first, so a linear merge keeps
+    # that order without re-sorting, and can stop as soon as the feed is full.
+    # A URL listed more than once keeps its first copy in merged order, i.e.
+    # the most recently dated one.
+    merged: list[Item] = []
+    if total_limit <= 0:
+        return merged
 
-            if existing.get("published") is None and item.get("published") is not None:
-                by_url[url] = item
+    seen: set[str] = set()
 
-    merged = list(by_url.values())
-    merged.sort(key=lambda x: x.get("published") or EPOCH, reverse=True)
-    return merged[:total_limit]
-
-
-def write_rss(items: list[dict], out_file: str, home_link: str) -> None:
-    fg = FeedGenerator()
-    fg.title("Colliers + Northmarq (unofficial)")
-    fg.link(href=home_link, rel="alternate")
-    fg.description("Unofficial combined feed: Colliers news/research + Northmarq recent transactions.")
-    fg.language("en")
-    fg.updated(datetime.now(UTC))
-
-    for item in items:
-        fe = fg.add_entry()
-        fe.id(item["url"])
-        fe.link(href=item["url"])
-        fe.title(f"[{item['source']}] {item['title']}")
-
-        if item.get("published"):
-            fe.published(item["published"])
+    for item in heapq.merge(*lists, key=published_sort_key, reverse=True):
+        if item.url in seen:
+            continue
+        seen.add(item.url)
+        merged.append(item)
 
-        if item.get("description"):
-            fe.description(item["description"])
-        else:
-            fe.description(item["url"])
+        if len(merged) >= total_limit:
+            break
 
-        fe.category(term=item["source"])
+    return merged
+
+
+def rss_text(value: str) -> str:
+    return escape(XML_ILLEGAL_CHARS_RE.sub("", value), RSS_ENTITIES)
+
+
+def write_rss(items: list[Item], out_file: str, home_link: str) -> None:
+    # The feed has a fixed shape, so it is written straight out as text
+    # rather than built up as an XML tree first.
+    parts = [
+        "<?xml version='1.0' encoding='UTF-8'?>\n",
+        '<rss version="2.0"><channel>',
+        f"<title>{rss_text(RSS_TITLE)}</title>",
+        f"<link>{rss_text(home_link)}</link>",
+        f"<description>{rss_text(RSS_DESCRIPTION)}</description>",
+        "<docs>http://www.rssboard.org/rss-specification</docs>",
+        "<language>en</language>",
+        f"<lastBuildDate>{format_datetime(datetime.now(UTC))}</lastBuildDate>",
+    ]
+
+    # Entries have always been listed oldest first.
+    for item in reversed(items):
+        url = rss_text(item.url)
+        parts.append("<item>")
+        parts.append(f"<title>{rss_text(f'[{item.source}] {item.title}')}</title>")
+        parts.append(f"<link>{url}</link>")
+        parts.append(f"<description>{rss_text(item.description) if item.description else url}</description>")
+        parts.append(f'<guid isPermaLink="false">{url}</guid>')
+        parts.append(f"<category>{rss_text(item.source)}</category>")
+        if item.published:
+            parts.append(f"<pubDate>{format_datetime(item.published)}</pubDate>")
+        parts.append("</item>")
+
+    parts.append("</channel></rss>")
 
     out_dir = os.path.dirname(out_file)
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
 
-    fg.rss_file(out_file, pretty=True)
+    # Writing beside the target then renaming means nobody ever fetches a
+    # half-written feed.
+    tmp_file = f"{out_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+    os.replace(tmp_file, out_file)
 
 
 def main():
@@ -620,17 +955,33 @@ def main():
     parser.add_argument("--total_limit", type=int, default=160)
 
     parser.add_argument("--out", default="docs/colliers-news.xml")
+    parser.add_argument(
+        "--http_cache",
+        default=".cache/http",
+        help="SQLite HTTP cache (requests-cache adds .sqlite); pass an empty string to disable",
+    )
 
     args = parser.parse_args()
 
     colliers_url = args.colliers or args.listing or COLLIERS_DEFAULT_URL
 
-    colliers_items = get_colliers_items(colliers_url, limit=args.colliers_limit)
-    northmarq_items = get_northmarq_items(
-        args.northmarq_base,
-        pages=args.northmarq_pages,
-        limit=args.northmarq_limit,
-    )
+    # The two sources are independent, so their network waits can overlap.
+    with http_session(args.http_cache) as session, ThreadPoolExecutor(max_workers=2) as pool:
+        colliers_future = pool.submit(
+            get_colliers_items,
+            session,
+            colliers_url,
+            limit=args.colliers_limit,
+        )
+        northmarq_future = pool.submit(
+            get_northmarq_items,
+            session,
+            args.northmarq_base,
+            pages=args.northmarq_pages,
+            limit=args.northmarq_limit,
+        )
+        colliers_items = colliers_future.result()
+        northmarq_items = northmarq_future.result()
 
     combined = merge_items([colliers_items, northmarq_items], total_limit=args.total_limit)
 